@@ -1,52 +1,267 @@
 """Simple configuration loader for Market Risk Analytics."""
 
-import yaml
+import array
+import copy
+import functools
+import json
+import os
+import sys
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 
+# yaml, tomllib and numpy are imported where they are used, so importing this
+# module stays cheap for code that only works with an already-loaded config
+if TYPE_CHECKING:
+    import numpy as np
 
-def load_config(config_path: str = None) -> Dict[str, Any]:
+# Default to config/config.yaml relative to project root
+_DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[2] / "config" / "config.yaml"
+
+# Accepted types for base position sizes (bool is deliberately excluded)
+_NUMERIC_TYPES = (int, float)
+
+# JSON copy of the validated default config, stored next to config.yaml.
+# JSON (unlike pickle) cannot execute code when a sidecar is tampered with.
+_SIDECAR_PATH = _DEFAULT_CONFIG_PATH.with_name(_DEFAULT_CONFIG_PATH.name + ".cache.json")
+
+
+def _read_sidecar(mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
     """
-    Load configuration from YAML file.
+    Load the default config as written by a previous run, if still current.
 
-    Args:
-        config_path: Path to config file. If None, uses default location.
+    Returns None when there is no sidecar, it was written for another version
+    of config.yaml (different mtime or size), or it cannot be decoded.
+    """
+    try:
+        with open(_SIDECAR_PATH, 'rb') as f:
+            sidecar = json.loads(f.read())
+        if sidecar['mtime_ns'] == mtime_ns and sidecar['size'] == size:
+            return sidecar['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
 
-    Returns:
-        Dictionary containing configuration
+
+def _write_sidecar(mtime_ns: int, size: int, config: Dict[str, Any]) -> None:
+    """
+    Store the validated default config as JSON next to config.yaml.
+
+    The sidecar is best-effort: configs that do not survive a JSON round trip
+    unchanged (dates, non-string keys) and read-only checkouts simply leave no
+    sidecar behind. The file is swapped in with os.replace so concurrent
+    readers never see a partial write.
+    """
+    try:
+        payload = json.dumps({'mtime_ns': mtime_ns, 'size': size, 'config': config})
+    except (TypeError, ValueError):
+        return
+    if json.loads(payload)['config'] != config:
+        return
+
+    tmp = _SIDECAR_PATH.with_name(f"{_SIDECAR_PATH.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(payload)
+        os.replace(tmp, _SIDECAR_PATH)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+class _Source:
+    """
+    Open descriptor of the config file being loaded.
+
+    Passed to _load_config_cached alongside the cache key but deliberately
+    excluded from it: every _Source hashes and compares equal, so only
+    (path, mtime_ns, size) decide cache hits.
+    """
+
+    __slots__ = ('fd',)
+
+    def __init__(self, fd: int):
+        self.fd = fd
+
+    def __hash__(self) -> int:
+        return 0
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Source)
+
+
+class _FileChanged(Exception):
+    """The config file was rewritten while it was being read."""
+
+
+def _read_all(fd: int, size: int) -> bytes:
+    """
+    Read a whole file from an open descriptor.
+
+    Reads until EOF, since a single os.read may return short on FUSE or
+    remote mounts.
 
     Raises:
-        FileNotFoundError: If config file doesn't exist
-        ValueError: If config is invalid
+        _FileChanged: If the content read does not match the fstat size
     """
+    chunks = []
+    while True:
+        chunk = os.read(fd, max(size, 1 << 16))
+        if not chunk:
+            break
+        chunks.append(chunk)
+    data = b"".join(chunks)
+    if len(data) != size:
+        raise _FileChanged
+    return data
 
-    if config_path is None:
-        # Default to config/config.yaml relative to project root
-        project_root = Path(__file__).parent.parent.parent
-        config_path = project_root / "config" / "config.yaml"
-    else:
-        config_path = Path(config_path)
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+def _parse(filepath: Path, data: bytes) -> Dict[str, Any]:
+    """Parse config file content according to its suffix (.toml, .json, else YAML)."""
+    suffix = filepath.suffix.lower()
+    if suffix == '.toml':
+        import tomllib
+        return tomllib.loads(data.decode())
+    if suffix == '.json':
+        return json.loads(data)
 
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    import yaml
+    # libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(data, Loader=loader)
 
-    # Validate required fields
-    if 'currency_pairs' not in config:
-        raise ValueError("Config must contain 'currency_pairs' section")
 
-    if not config['currency_pairs']:
-        raise ValueError("'currency_pairs' section cannot be empty")
+def _validate(config: Dict[str, Any]) -> None:
+    """
+    Check the currency_pairs section.
+
+    Raises:
+        ValueError: If config is invalid
+    """
+    if not isinstance(config, dict):
+        raise ValueError("Config file must contain a mapping at the top level")
+
+    # Validate required fields
+    pairs = config.get('currency_pairs')
+    if not isinstance(pairs, dict) or not pairs:
+        raise ValueError("Config must contain non-empty 'currency_pairs' section")
 
     # Validate that all currency pairs have base sizes
-    for pair, size in config['currency_pairs'].items():
-        if not isinstance(size, (int, float)) or size <= 0:
+    for pair, size in pairs.items():
+        if size.__class__ not in _NUMERIC_TYPES or size <= 0:
             raise ValueError(
                 f"Invalid base size for {pair}: {size}. Must be positive number."
             )
-    return config
+
+
+def _sizes_array(base_sizes: Mapping[str, float]) -> "np.ndarray":
+    """Base sizes as a float64 array, in the mapping's pair order."""
+    import numpy as np
+
+    return np.fromiter(base_sizes.values(), dtype=np.float64, count=len(base_sizes))
+
+
+class _CachedConfig(NamedTuple):
+    """Validated config plus the pair views derived from it, cached together."""
+
+    config: Dict[str, Any]
+    currency_pairs: Tuple[str, ...]
+    base_sizes_array: "np.ndarray"
+
+
+def _derive(config: Dict[str, Any]) -> _CachedConfig:
+    """Precompute the currency pair views shared by every caller."""
+    # Pair names key many downstream dicts; interning lets lookups short-circuit
+    # on identity
+    config['currency_pairs'] = {
+        sys.intern(pair): size for pair, size in config['currency_pairs'].items()
+    }
+
+    sizes = _sizes_array(config['currency_pairs'])
+    sizes.flags.writeable = False
+    return _CachedConfig(config, tuple(config['currency_pairs']), sizes)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_config_cached(
+    path: str, mtime_ns: int, size: int, source: _Source
+) -> _CachedConfig:
+    """
+    Parse and validate a config file.
+
+    Cached on (path, mtime_ns, size), so an edited file is picked up on the
+    next call while an unchanged one is parsed once per process. For the
+    default config.yaml, a fresh process reuses the JSON sidecar written by a
+    previous run instead of re-parsing the YAML, as long as the file's mtime
+    and size still match. The file content is only read, from the descriptor
+    the key was taken from, on a cache miss.
+    """
+    filepath = Path(path)
+    is_default = filepath == _DEFAULT_CONFIG_PATH
+
+    config = _read_sidecar(mtime_ns, size) if is_default else None
+    if config is None:
+        config = _parse(filepath, _read_all(source.fd, size))
+        _validate(config)
+        if is_default:
+            _write_sidecar(mtime_ns, size, config)
+    else:
+        # A sidecar is only a cache: never trust it more than the source file
+        _validate(config)
+    return _derive(config)
+
+
+# A config file rewritten mid-read is re-opened a few times before giving up
+_READ_ATTEMPTS = 3
+
+
+def _load(config_path: Optional[Union[str, Path]]) -> _CachedConfig:
+    """Resolve a config path and return its cached, validated entry."""
+    if config_path is None:
+        config_path = _DEFAULT_CONFIG_PATH
+    elif not isinstance(config_path, Path):
+        config_path = Path(config_path)
+    path = os.path.abspath(config_path)
+
+    for _ in range(_READ_ATTEMPTS):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
+        try:
+            # The cache key and the content come from the same open file
+            st = os.fstat(fd)
+            return _load_config_cached(
+                path, st.st_mtime_ns, st.st_size, _Source(fd)
+            )
+        except _FileChanged:
+            continue
+        finally:
+            os.close(fd)
+
+    raise OSError(f"Config file kept changing while being read: {config_path}")
+
+
+def load_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """
+    Load configuration from a YAML, TOML or JSON file.
+
+    Args:
+        config_path: Path to config file. If None, uses default location
+            (config/config.yaml). The format follows the file suffix.
+
+    Returns:
+        Dictionary containing configuration
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        ValueError: If config is invalid
+    """
+
+    # Callers get their own copy so they cannot mutate the cached config
+    return copy.deepcopy(_load(config_path).config)
+
 
 def get_currency_pairs(config: Dict[str, Any]) -> list:
     """
@@ -60,7 +275,7 @@ def get_currency_pairs(config: Dict[str, Any]) -> list:
     """
     return list(config['currency_pairs'].keys())
 
-def get_base_sizes(config: Dict[str, Any]) -> Dict[str, float]:
+def get_base_sizes(config: Dict[str, Any]) -> Mapping[str, float]:
     """
     Get base position sizes for each currency pair.
 
@@ -68,18 +283,68 @@ def get_base_sizes(config: Dict[str, Any]) -> Dict[str, float]:
         config: Configuration dictionary
 
     Returns:
-        Dictionary mapping currency pair to base size
+        Read-only view mapping currency pair to base size (no need to copy
+        it defensively)
     """
-    return config['currency_pairs']
+    return MappingProxyType(config['currency_pairs'])
+
+def get_base_sizes_array(config: Dict[str, Any]) -> "np.ndarray":
+    """
+    Get base position sizes as a float64 array.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        New array of base sizes, ordered like get_currency_pairs(config)
+    """
+    return _sizes_array(config['currency_pairs'])
+
+def get_base_sizes_buffer(config: Dict[str, Any]) -> array.array:
+    """
+    Get base position sizes as a flat buffer of C doubles, without NumPy.
+
+    Wrapping it with np.frombuffer(buf, dtype=np.float64) does not copy.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        New array.array with typecode 'd', ordered like
+        get_currency_pairs(config)
+    """
+    return array.array('d', config['currency_pairs'].values())
+
+def get_pair_index(config: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Get the position of each currency pair in get_base_sizes_array(config).
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Dictionary mapping currency pair to array index
+    """
+    return {pair: i for i, pair in enumerate(config['currency_pairs'])}
+
+class ConfigBundle(NamedTuple):
+    """Loaded config together with its precomputed currency pair views."""
+
+    config: Dict[str, Any]
+    currency_pairs: Sequence[str]
+    base_sizes: Mapping[str, float]
+    base_sizes_array: "np.ndarray"
 
 # For easy notebook usage
-def quick_load():
+def quick_load() -> ConfigBundle:
     """Quick load with defaults - for notebook convenience."""
 
-    config = load_config()
+    cached = _load(None)
+    config = copy.deepcopy(cached.config)
 
-    return {
-        'config': config,
-        'currency_pairs': get_currency_pairs(config),
-        'base_sizes': get_base_sizes(config)
-    }
\ No newline at end of file
+    return ConfigBundle(
+        config,
+        cached.currency_pairs,
+        get_base_sizes(config),
+        cached.base_sizes_array
+    )
@@ -0,0 +1,169 @@
+"""Tests for the cached configuration loader."""
+
+import datetime
+import json
+import os
+
+import pytest
+
+from src.utils import config_loader
+from src.utils.config_loader import load_config
+
+
+VALID_CONFIG = "currency_pairs:\n  EURUSD: 1\n"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    config_loader._load_config_cached.cache_clear()
+    yield
+    config_loader._load_config_cached.cache_clear()
+
+
+def write_config(path, text, mtime_ns=None):
+    path.write_text(text)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_repeat_load_is_served_from_cache(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_config(path, VALID_CONFIG)
+
+    assert load_config(path) == load_config(path)
+
+    info = config_loader._load_config_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_edit_with_restored_mtime_is_detected_by_size(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_config(path, VALID_CONFIG, mtime_ns=1_700_000_000_000_000_000)
+    assert load_config(path)['currency_pairs'] == {'EURUSD': 1}
+
+    write_config(
+        path,
+        "currency_pairs:\n  EURUSD: 22\n  GBPUSD: 3\n",
+        mtime_ns=1_700_000_000_000_000_000,
+    )
+    assert load_config(path)['currency_pairs'] == {'EURUSD': 22, 'GBPUSD': 3}
+
+
+def test_same_size_edit_is_detected_by_mtime(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_config(path, VALID_CONFIG, mtime_ns=1_700_000_000_000_000_000)
+    assert load_config(path)['currency_pairs'] == {'EURUSD': 1}
+
+    write_config(path, VALID_CONFIG.replace("1", "2"), mtime_ns=1_700_000_001_000_000_000)
+    assert load_config(path)['currency_pairs'] == {'EURUSD': 2}
+
+
+def test_caller_mutation_does_not_leak_into_cache(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_config(path, VALID_CONFIG)
+
+    first = load_config(path)
+    first['currency_pairs']['GBPUSD'] = 5
+    first['timezone'] = "UTC"
+
+    second = load_config(path)
+    assert second == {'currency_pairs': {'EURUSD': 1}}
+    assert second['currency_pairs'] is not first['currency_pairs']
+
+
+def test_invalid_file_is_not_cached(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_config(path, "currency_pairs:\n  EURUSD: -5\n", mtime_ns=1_700_000_000_000_000_000)
+    with pytest.raises(ValueError):
+        load_config(path)
+
+    write_config(path, "currency_pairs:\n  EURUSD: 55\n", mtime_ns=1_700_000_001_000_000_000)
+    assert load_config(path)['currency_pairs'] == {'EURUSD': 55}
+
+
+@pytest.mark.parametrize("text", ["", "- EURUSD\n", "currency_pairs: [EURUSD]\n"])
+def test_malformed_config_raises_value_error(tmp_path, text):
+    path = tmp_path / "config.yaml"
+    write_config(path, text)
+    with pytest.raises(ValueError):
+        load_config(path)
+
+
+def test_missing_file_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_config(tmp_path / "missing.yaml")
+
+
+@pytest.fixture
+def default_config(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    monkeypatch.setattr(config_loader, "_DEFAULT_CONFIG_PATH", path)
+    monkeypatch.setattr(config_loader, "_SIDECAR_PATH", tmp_path / "config.yaml.cache.json")
+    return path
+
+
+def fail_parse(filepath, data):
+    raise AssertionError("config file was parsed instead of using the sidecar")
+
+
+def test_default_config_reuses_sidecar(default_config, monkeypatch):
+    write_config(default_config, VALID_CONFIG)
+    assert load_config() == {'currency_pairs': {'EURUSD': 1}}
+    assert config_loader._SIDECAR_PATH.exists()
+
+    config_loader._load_config_cached.cache_clear()
+    monkeypatch.setattr(config_loader, "_parse", fail_parse)
+    assert load_config() == {'currency_pairs': {'EURUSD': 1}}
+
+
+def test_stale_sidecar_is_ignored(default_config):
+    write_config(default_config, VALID_CONFIG, mtime_ns=1_700_000_000_000_000_000)
+    load_config()
+
+    write_config(
+        default_config,
+        "currency_pairs:\n  EURUSD: 2\n  GBPUSD: 3\n",
+        mtime_ns=1_700_000_000_000_000_000,
+    )
+    config_loader._load_config_cached.cache_clear()
+    assert load_config()['currency_pairs'] == {'EURUSD': 2, 'GBPUSD': 3}
+
+    write_config(
+        default_config,
+        "currency_pairs:\n  EURUSD: 4\n  GBPUSD: 3\n",
+        mtime_ns=1_700_000_001_000_000_000,
+    )
+    config_loader._load_config_cached.cache_clear()
+    assert load_config()['currency_pairs'] == {'EURUSD': 4, 'GBPUSD': 3}
+
+
+def test_tampered_sidecar_is_revalidated(default_config):
+    write_config(default_config, VALID_CONFIG)
+    load_config()
+
+    sidecar = json.loads(config_loader._SIDECAR_PATH.read_text())
+    sidecar['config'] = {'currency_pairs': {'EURUSD': -1}}
+    config_loader._SIDECAR_PATH.write_text(json.dumps(sidecar))
+
+    config_loader._load_config_cached.cache_clear()
+    with pytest.raises(ValueError):
+        load_config()
+
+
+def test_quick_load_mutation_does_not_leak_into_cache(default_config):
+    write_config(default_config, VALID_CONFIG)
+    config_loader.quick_load().config['currency_pairs']['EURUSD'] = 99
+    assert config_loader.quick_load().config == {'currency_pairs': {'EURUSD': 1}}
+
+
+def test_explicit_path_writes_no_sidecar(default_config, tmp_path):
+    path = tmp_path / "other.yaml"
+    write_config(path, VALID_CONFIG)
+    load_config(path)
+    assert not config_loader._SIDECAR_PATH.exists()
+
+
+def test_config_that_does_not_round_trip_writes_no_sidecar(default_config):
+    write_config(default_config, VALID_CONFIG + "start_date: 2024-01-01\n")
+    assert load_config()['start_date'] == datetime.date(2024, 1, 1)
+    assert not config_loader._SIDECAR_PATH.exists()